@@ -1,136 +1,285 @@
-class SkipList:
-    """Complete Python conversion of the Java MySkipList with all features."""
+import random
+from collections import deque
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _walk_forward(nxt, start, steps):
+    """Follow the next-link array `steps` hops from slot `start`."""
+    cur = start
+    for _ in range(steps):
+        cur = nxt[cur]
+    return cur
+
+
+def _walk_backward(prv, start, steps):
+    """Follow the prev-link array `steps` hops from slot `start`."""
+    cur = start
+    for _ in range(steps):
+        cur = prv[cur]
+    return cur
+
+
+def _collect_order(nxt, head, size):
+    """Materialize the slots of the list in traversal order."""
+    out = np.empty(size, dtype=np.int32)
+    cur = head
+    for i in range(size):
+        out[i] = cur
+        cur = nxt[cur]
+    return out
+
+
+def _find_slot(targets, cum, fast_count, nxt, prv, head, index):
+    """Binary-search the cumulative gaps, then refine to the exact slot.
+
+    Returns (slot, k, pos) with k the first fast entry at or past index
+    (-1 when the layer is empty) and pos that entry's position. The
+    refinement walk runs from whichever neighbouring fast target is
+    closer to index; on a compacted layout it strides consecutive array
+    elements, so the prefetcher hides the link loads.
+    """
+    if fast_count == 0:
+        cur = np.int64(head)
+        for _ in range(index):
+            cur = nxt[cur]
+        return cur, np.int64(-1), np.int64(0)
+
+    lo = 1
+    hi = fast_count - 1
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if cum[mid] < index:
+            lo = mid + 1
+        else:
+            hi = mid
+    k = np.int64(lo)
+    pos = np.int64(cum[lo])
+    if pos == index:
+        return np.int64(targets[lo]), k, pos
+
+    if pos - index <= index - cum[lo - 1]:
+        cur = np.int64(targets[lo])
+        for _ in range(pos - index):
+            cur = prv[cur]
+    else:
+        cur = np.int64(targets[lo - 1])
+        for _ in range(index - cum[lo - 1]):
+            cur = nxt[cur]
+    return cur, k, pos
+
+
+if njit is not None:
+    # Compile the link walks to native loops over the int32 arrays; the
+    # pure-Python definitions above remain the fallback without numba.
+    _walk_forward = njit(cache=True)(_walk_forward)
+    _walk_backward = njit(cache=True)(_walk_backward)
+    _collect_order = njit(cache=True)(_collect_order)
+    _find_slot = njit(cache=True)(_find_slot)
 
-    class ListNode:
-        __slots__ = ("data", "prev", "next", "fast")
 
-        def __init__(self, data):
-            self.data = data
-            self.prev = None
-            self.next = None
-            self.fast = None
+class SkipList:
+    """Complete Python conversion of the Java MySkipList with all features.
 
-    class FastNode:
-        __slots__ = ("target", "prev", "next", "gap")
+    Storage is structure-of-arrays: node payloads live in an object ndarray
+    and the prev/next links are int32 ndarrays of slot indices, with NIL (-1)
+    meaning null. The fast layer is a pair of parallel arrays (target slot,
+    gap to previous fast entry) whose first entry tracks the head and whose
+    last entry tracks the tail.
 
-        def __init__(self, target=None, prev=None, next=None, gap=0):
-            self.target = target
-            self.prev = prev
-            self.next = next
-            self.gap = gap
+    Passing a numeric dtype (e.g. SkipList(dtype='int64')) stores payloads
+    unboxed in a typed ndarray instead of as Python objects, trading
+    generality for a flat 8-bytes-per-element footprint.
+    """
 
     MIN_SKIP = 25
+    MIN_SKIP_BITS = MIN_SKIP.bit_length()
     REBALANCE_THRESHOLD = 100
-    SKIP_GROWTH_FACTOR = 1.5
-
-    def __init__(self):
-        self.head = None
-        self.tail = None
+    INITIAL_CAPACITY = 64
+    INITIAL_FAST_CAPACITY = 8
+    NIL = -1
+
+    def __init__(self, dtype=None):
+        self._dtype = np.dtype(dtype) if dtype is not None else None
+        cap = self.INITIAL_CAPACITY
+        self._data = self._new_data(cap)
+        self._next = np.full(cap, self.NIL, dtype=np.int32)
+        self._prev = np.full(cap, self.NIL, dtype=np.int32)
+        self._free = list(range(cap - 1, -1, -1))
+
+        self.head = self.NIL
+        self.tail = self.NIL
         self.size = 0
 
-        self.fast_head = None
-        self.fast_tail = None
+        # Fast layer: entry 0 tracks the head, entry fast_count-1 tracks
+        # the tail; _fast_gap[k] is the distance from entry k-1's target to
+        # entry k's target, so the running sum of gaps is a list position.
+        fast_cap = self.INITIAL_FAST_CAPACITY
+        self._fast_target = np.full(fast_cap, self.NIL, dtype=np.int32)
+        # Gaps can grow without bound between rebalances (repeated inserts
+        # at one position widen a single entry), so they get the same int32
+        # width as the cumulative positions.
+        self._fast_gap = np.zeros(fast_cap, dtype=np.int32)
+        self._fast_cum = np.zeros(fast_cap, dtype=np.int32)
         self.fast_count = 0
 
-        self.pending_gap = 0
-        self.current_skip = self.MIN_SKIP
         self.ops_since_rebalance = 0
 
+        # True while slot k holds the node at position k (fresh lists,
+        # appends and tail removals preserve this; compaction restores it).
+        # While it holds, get_node is a constant-time identity.
+        self._sequential = True
+
+        # Value -> deque of slots holding it, for O(1) remove-by-value.
+        # Values must be hashable (as documented for this class).
+        self._index = {}
+
+    # -------------------------------
+    # Slot allocation
+    # -------------------------------
+
+    def _new_data(self, cap):
+        """Allocate a payload array (object or typed, per dtype)."""
+        if self._dtype is None:
+            return np.empty(cap, dtype=object)
+        return np.zeros(cap, dtype=self._dtype)
+
+    def _grow(self):
+        """Double the backing arrays and push the new slots on the free list."""
+        old_cap = len(self._data)
+        new_cap = old_cap * 2
+        self._data = np.resize(self._data, new_cap)
+        if self._dtype is None:
+            self._data[old_cap:] = None
+        self._next = np.resize(self._next, new_cap)
+        self._prev = np.resize(self._prev, new_cap)
+        self._free.extend(range(new_cap - 1, old_cap - 1, -1))
+
+    def _alloc(self, value):
+        """Take a free slot, store value in it, and return its index."""
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self._data[slot] = value
+        self._next[slot] = self.NIL
+        self._prev[slot] = self.NIL
+        return slot
+
+    def _release(self, slot):
+        """Return a slot to the free list, dropping its payload reference."""
+        if self._dtype is None:
+            self._data[slot] = None
+        self._next[slot] = self.NIL
+        self._prev[slot] = self.NIL
+        self._free.append(slot)
+
+    def _value_at(self, slot):
+        """Payload at slot, unboxed to a Python scalar for typed storage."""
+        value = self._data[slot]
+        return value.item() if self._dtype is not None else value
+
+    def _index_discard(self, value, slot):
+        """Drop one slot from the value index bucket."""
+        bucket = self._index.get(value)
+        if bucket is not None:
+            try:
+                bucket.remove(slot)
+            except ValueError:
+                pass
+            if not bucket:
+                del self._index[value]
+
     # -------------------------------
     # Core helpers
     # -------------------------------
 
     def _get_dynamic_skip(self):
-        """Calculate optimal skip distance based on current size."""
+        """Target skip distance (~sqrt(n)) for the current size."""
         if self.size <= 1:
             return self.MIN_SKIP
+        return max(self.MIN_SKIP, int(self.size ** 0.5))
 
-        if self.size > self.current_skip * self.SKIP_GROWTH_FACTOR:
-            potential = min(
-                int(self.current_skip * self.SKIP_GROWTH_FACTOR),
-                int(self.size ** 0.5)
-            )
-            self.current_skip = potential
-
-        return max(self.MIN_SKIP, self.current_skip)
+    def _ensure_fast_capacity(self, n):
+        """Grow the fast-layer arrays to hold at least n entries."""
+        cap = len(self._fast_target)
+        if n <= cap:
+            return
+        while cap < n:
+            cap *= 2
+        self._fast_target = np.resize(self._fast_target, cap)
+        self._fast_gap = np.resize(self._fast_gap, cap)
+        self._fast_cum = np.resize(self._fast_cum, cap)
 
     def _init_fast_layer(self):
-        """Initialize fast layer sentinels."""
-        if self.head is None or self.fast_head is not None:
+        """Initialize fast layer sentinel entries."""
+        if self.head == self.NIL or self.tail == self.NIL or self.fast_count:
             return
 
-        try:
-            self.fast_head = self.FastNode(self.head, gap=0)
-            self.head.fast = self.fast_head
-
-            if self.head == self.tail:
-                self.fast_tail = self.FastNode(self.tail, self.fast_head, None, 0)
-            else:
-                self.fast_tail = self.FastNode(self.tail, self.fast_head, None, max(1, self.size - 1))
-
-            self._update_tail_fast()
-            self.fast_head.next = self.fast_tail
-            self.fast_tail.prev = self.fast_head
-            self.fast_count = 2
-
-            # Verify initialization
-            if self.fast_head.target is None or self.fast_tail.target is None:
-                self._clear_fast_layer()
-        except:
-            self._clear_fast_layer()
+        self._ensure_fast_capacity(2)
+        self._fast_target[0] = self.head
+        self._fast_gap[0] = 0
+        self._fast_target[1] = self.tail
+        self._fast_gap[1] = self.size - 1 if self.size > 2 else (0 if self.head == self.tail else 1)
+        self._fast_cum[0] = 0
+        self._fast_cum[1] = self._fast_gap[1]
+        self.fast_count = 2
 
     def _clear_fast_layer(self):
-        """Clear the fast layer completely."""
-        self.fast_head = None
-        self.fast_tail = None
+        """Clear the fast layer completely (the buffers are kept)."""
         self.fast_count = 0
-        if self.head:
-            self.head.fast = None
-        if self.tail:
-            self.tail.fast = None
 
     def _update_tail_fast(self):
-        """Update fast tail sentinel to point to current tail."""
-        if self.fast_tail:
-            self.fast_tail.target = self.tail
-            if self.tail:
-                self.tail.fast = self.fast_tail
-
-    def _append_fast(self, node, gap):
-        """Append a new fast node before tail sentinel."""
-        if self.fast_tail is None or self.fast_tail.prev is None or node is None:
+        """Update fast tail entry to point to current tail."""
+        if self.fast_count:
+            self._fast_target[self.fast_count - 1] = self.tail
+
+    def _append_fast(self, slot, gap):
+        """Append a new fast entry before the tail entry."""
+        if self.fast_count < 2 or slot == self.NIL:
             return
 
-        fn = self.FastNode(node, self.fast_tail.prev, self.fast_tail, gap)
-        self.fast_tail.prev.next = fn
-        self.fast_tail.prev = fn
-        node.fast = fn
+        fc = self.fast_count
+        self._ensure_fast_capacity(fc + 1)
+        self._fast_target[fc] = self._fast_target[fc - 1]
+        self._fast_gap[fc] = self._fast_gap[fc - 1]
+        self._fast_cum[fc] = self._fast_cum[fc - 1]
+        self._fast_target[fc - 1] = slot
+        self._fast_gap[fc - 1] = gap
+        self._fast_cum[fc - 1] = self._fast_cum[fc - 2] + gap
         self.fast_count += 1
 
-    def _remove_fast(self, fn):
-        """Remove a fast node and update gaps."""
-        if fn is None or fn is self.fast_head or fn is self.fast_tail:
+    def _remove_fast(self, k):
+        """Remove fast entry k and merge its gap into the next entry."""
+        if k <= 0 or k >= self.fast_count - 1:
             return
 
-        # Update gap - merge with previous
-        if fn.prev and fn.next:
-            fn.next.gap = max(1, fn.next.gap + fn.gap)
-
-        # Update fast layer links
-        if fn.prev:
-            fn.prev.next = fn.next
-        if fn.next:
-            fn.next.prev = fn.prev
-
-        # Clear main list node's fast link
-        if fn.target:
-            fn.target.fast = None
-
-        # Clear removed node's references
-        fn.prev = fn.next = fn.target = None
-
-        if self.fast_count > 2:
-            self.fast_count -= 1
+        fc = self.fast_count
+        merged = int(self._fast_gap[k + 1]) + int(self._fast_gap[k])
+        self._fast_gap[k + 1] = merged if merged > 1 else 1
+        self._fast_target[k:fc - 1] = self._fast_target[k + 1:fc]
+        self._fast_gap[k:fc - 1] = self._fast_gap[k + 1:fc]
+        self._fast_cum[k:fc - 1] = self._fast_cum[k + 1:fc]
+        self.fast_count -= 1
+
+    def _locate(self, index):
+        """Find the node at index and its covering fast entry in one pass.
+
+        Returns (slot, k, pos): slot holds the node at index, k is the
+        first fast entry at or past index (-1 when none) and pos is that
+        entry's position. Fuses the gap scan needed by insert/remove_at
+        with the jump-and-refine walk of get_node so mutations traverse
+        the fast layer only once; the whole walk runs natively when numba
+        is available.
+        """
+        slot, k, pos = _find_slot(
+            self._fast_target, self._fast_cum, self.fast_count,
+            self._next, self._prev, self.head, index)
+        return int(slot), int(k), int(pos)
 
     def _check_and_rebalance(self):
         """Check if rebalancing is needed and perform it."""
@@ -146,32 +295,72 @@ class SkipList:
 
     def add(self, value):
         """Append element to end of list - O(1) amortized."""
-        node = self.ListNode(value)
+        slot = self._alloc(value)
+        self._index.setdefault(value, deque()).appendleft(slot)
 
-        if self.head is None:
-            self.head = self.tail = node
+        if self.head == self.NIL:
+            self.head = self.tail = slot
             self.size = 1
             self._init_fast_layer()
-            self.pending_gap = 0
             return
 
         # Append to tail
-        node.prev = self.tail
-        self.tail.next = node
-        self.tail = node
+        self._prev[slot] = self.tail
+        self._next[self.tail] = slot
+        self.tail = slot
         self.size += 1
+        if slot != self.size - 1:
+            self._sequential = False
 
         self._update_tail_fast()
-        self.pending_gap += 1
-
-        # Check if we need a new fast node before tail
-        if self.pending_gap >= self._get_dynamic_skip():
-            before_tail = self.tail.prev
-            self._append_fast(before_tail, self.pending_gap - 1)
-            self.fast_tail.gap = 1
-            self.pending_gap = 1
-        else:
-            self.fast_tail.gap = self.pending_gap
+        fc = self.fast_count
+        self._fast_gap[fc - 1] += 1
+        self._fast_cum[fc - 1] += 1
+
+        # Geometric promotion: one RNG draw, find-first-set decides whether
+        # the node before the tail becomes a fast target. The threshold is
+        # half the size's bit length -- the bit length of ~sqrt(n) -- so the
+        # expected gap tracks the dynamic skip distance without the float
+        # pow in _get_dynamic_skip; appends pay only integer ops.
+        bits = random.getrandbits(64)
+        level = (bits & -bits).bit_length() if bits else 64
+        threshold = self.size.bit_length() >> 1
+        if threshold < self.MIN_SKIP_BITS:
+            threshold = self.MIN_SKIP_BITS
+        if level >= threshold and self._fast_gap[fc - 1] > 1:
+            before_tail = int(self._prev[self.tail])
+            self._append_fast(before_tail, int(self._fast_gap[fc - 1]) - 1)
+            self._fast_gap[self.fast_count - 1] = 1
+
+    def extend(self, values):
+        """Append every element of values - amortized bulk load.
+
+        Links all nodes first with no per-append promotion or gap
+        bookkeeping, then rebuilds the fast layer once, so bulk loads pay
+        one vectorized rebalance instead of n rounds of tail maintenance.
+        """
+        values = list(values)
+        if not values:
+            return
+
+        index = self._index
+        for value in values:
+            slot = self._alloc(value)
+            index.setdefault(value, deque()).appendleft(slot)
+            if self.head == self.NIL:
+                self.head = self.tail = slot
+            else:
+                self._prev[slot] = self.tail
+                self._next[self.tail] = slot
+                self.tail = slot
+            self.size += 1
+            if slot != self.size - 1:
+                self._sequential = False
+
+        if self.fast_count == 0:
+            self._init_fast_layer()
+        self._rebalance()
+        self.ops_since_rebalance = 0
 
     def insert(self, index, value):
         """Insert element at specified position - O(sqrt(n)) average."""
@@ -185,52 +374,46 @@ class SkipList:
 
         # Insert at head
         if index == 0:
-            node = self.ListNode(value)
-            node.next = self.head
-            if self.head:
-                self.head.prev = node
+            slot = self._alloc(value)
+            self._index.setdefault(value, deque()).appendleft(slot)
+            self._next[slot] = self.head
+            if self.head != self.NIL:
+                self._prev[self.head] = slot
             else:
-                self.tail = node
-            self.head = node
+                self.tail = slot
+            self.head = slot
             self.size += 1
+            self._sequential = False
 
             if self.size == 1:
                 self._init_fast_layer()
-            elif self.fast_head:
-                self.fast_head.target = self.head
-                self.head.fast = self.fast_head
-                if self.fast_head.next:
-                    self.fast_head.next.gap = max(1, self.fast_head.next.gap + 1)
+            elif self.fast_count:
+                self._fast_target[0] = self.head
+                self._fast_gap[1] += 1
+                self._fast_cum[1:self.fast_count] += 1
             return
 
-        # Find the fast node that needs gap update
-        fast = self.fast_head
-        update_fast = None
-        traversed = 0
-
-        while fast and fast.next:
-            if traversed + fast.next.gap > index:
-                update_fast = fast.next
-                break
-            traversed += fast.next.gap
-            fast = fast.next
-
-        # Insert at position
-        curr = self.get_node(index)
-        if curr is None:
+        # One fused pass finds both the node and the fast entry that
+        # needs a gap update
+        curr, update_fast, _ = self._locate(index)
+        if curr == self.NIL:
             raise ValueError("Target node not found")
 
-        node = self.ListNode(value)
-        node.prev = curr.prev
-        node.next = curr
-        if curr.prev:
-            curr.prev.next = node
-        curr.prev = node
+        slot = self._alloc(value)
+        self._index.setdefault(value, deque()).appendleft(slot)
+        before = int(self._prev[curr])
+        self._prev[slot] = before
+        self._next[slot] = curr
+        if before != self.NIL:
+            self._next[before] = slot
+        self._prev[curr] = slot
         self.size += 1
+        self._sequential = False
 
-        # Update gap for affected fast node
-        if update_fast:
-            update_fast.gap = max(1, update_fast.gap + 1)
+        # Update gap for affected fast entry
+        if update_fast != -1:
+            self._fast_gap[update_fast] += 1
+            self._fast_cum[update_fast:self.fast_count] += 1
 
         # Consider rebalancing for internal insertions
         if index > 1 and index < self.size - 1:
@@ -245,84 +428,94 @@ class SkipList:
         # Remove head
         if index == 0:
             old_head = self.head
-            data = old_head.data
+            data = self._value_at(old_head)
+            self._index_discard(data, old_head)
 
-            self.head = old_head.next
-            if self.head:
-                self.head.prev = None
+            self.head = int(self._next[old_head])
+            if self.head != self.NIL:
+                self._prev[self.head] = self.NIL
             else:
-                self.tail = None
+                self.tail = self.NIL
+            self._release(old_head)
 
             self.size -= 1
+            self._sequential = False
             if self.size == 0:
                 self._clear_fast_layer()
-                self.pending_gap = 0
-                self.current_skip = self.MIN_SKIP
             else:
-                self.fast_head.target = self.head
-                self.head.fast = self.fast_head
-                if self.fast_head.next:
-                    self.fast_head.next.gap = max(1, self.fast_head.next.gap - 1)
+                self._fast_target[0] = self.head
+                if self.fast_count > 2 and self._fast_gap[1] <= 1:
+                    # Entry 1 now coincides with the head; drop it.
+                    self._remove_fast(1)
+                gap = int(self._fast_gap[1]) - 1
+                self._fast_gap[1] = gap if gap > 0 else 0
+                self._fast_cum[1:self.fast_count] -= 1
 
             return data
 
         # Remove tail
         if index == self.size - 1:
             old_tail = self.tail
-            data = old_tail.data
-
-            if self.tail.prev:
-                self.tail = old_tail.prev
-                self.tail.next = None
+            data = self._value_at(old_tail)
+            self._index_discard(data, old_tail)
+
+            before = int(self._prev[old_tail])
+            if before != self.NIL:
+                self.tail = before
+                self._next[self.tail] = self.NIL
+                self._release(old_tail)
                 self.size -= 1
 
                 self._update_tail_fast()
-                if self.fast_tail and self.fast_tail.prev:
-                    self.fast_tail.gap = max(1, self.pending_gap - 1)
-                self.pending_gap = max(0, self.pending_gap - 1)
+                fc = self.fast_count
+                if fc > 2 and self._fast_gap[fc - 1] <= 1:
+                    # The last interior entry now targets the tail; merge it
+                    # into the tail entry.
+                    self._fast_target[fc - 2] = self._fast_target[fc - 1]
+                    self._fast_cum[fc - 2] = self._fast_cum[fc - 1] - 1
+                    self.fast_count -= 1
+                else:
+                    # size >= 2 here (the single-element case clears the
+                    # layer below), so the tail gap is at least one.
+                    self._fast_gap[fc - 1] -= 1
+                    self._fast_cum[fc - 1] -= 1
             else:
-                self.head = self.tail = None
+                self.head = self.tail = self.NIL
+                self._release(old_tail)
                 self.size = 0
                 self._clear_fast_layer()
-                self.pending_gap = 0
-                self.current_skip = self.MIN_SKIP
 
             return data
 
-        # Find the fast node that needs gap update
-        fast = self.fast_head
-        update_fast = None
-        traversed = 0
-
-        while fast and fast.next:
-            if traversed + fast.next.gap > index:
-                update_fast = fast.next
-                break
-            traversed += fast.next.gap
-            fast = fast.next
-
-        # Remove internal node
-        target = self.get_node(index)
-        if target is None:
+        # One fused pass finds both the node and the fast entry that
+        # needs a gap update
+        target, update_fast, fast_pos = self._locate(index)
+        if target == self.NIL:
             raise ValueError("Node not found")
-        data = target.data
+        data = self._value_at(target)
+        self._index_discard(data, target)
 
         # Update main list connections
-        if target.prev:
-            target.prev.next = target.next
-        if target.next:
-            target.next.prev = target.prev
+        before = int(self._prev[target])
+        after = int(self._next[target])
+        if before != self.NIL:
+            self._next[before] = after
+        if after != self.NIL:
+            self._prev[after] = before
+        self._release(target)
 
         self.size -= 1
+        self._sequential = False
 
         # Update fast layer
-        if target.fast and target.fast is not self.fast_head and target.fast is not self.fast_tail:
-            fast_node = target.fast
-            if fast_node.next:
-                fast_node.next.gap += fast_node.gap - 1
-            self._remove_fast(fast_node)
-        elif update_fast:
-            update_fast.gap = max(1, update_fast.gap - 1)
+        if update_fast != -1:
+            if fast_pos == index and 0 < update_fast < self.fast_count - 1:
+                # The removed node was a fast target; merge then shrink the
+                # combined gap by the removed element.
+                self._remove_fast(update_fast)
+            gap = int(self._fast_gap[update_fast]) - 1
+            self._fast_gap[update_fast] = gap if gap > 0 else 1
+            self._fast_cum[update_fast:self.fast_count] -= 1
 
         # Rebalance for internal nodes
         if index > 1 and index < self.size - 1:
@@ -331,88 +524,37 @@ class SkipList:
         return data
 
     def remove(self, value):
-        """Remove first occurrence of value - optimized with chunk search."""
-        if self.head is None or value is None:
-            return False
-
-        # Quick check head/tail
-        if self.head.data == value:
-            self.remove_at(0)
-            return True
-        if self.tail.data == value:
-            self.remove_at(self.size - 1)
-            return True
-
-        # Parallel search from both ends
-        front_fast = self.fast_head
-        back_fast = self.fast_tail
-        front_idx = 0
-        back_idx = self.size - 1
-
-        while (front_fast and back_fast and
-               front_fast.next and back_fast.prev and
-               front_idx < back_idx):
-
-            # Check front chunk
-            if self._search_chunk(front_fast, value):
-                return True
-            front_idx += front_fast.next.gap
-            front_fast = front_fast.next
-
-            # Check back chunk
-            if front_idx < back_idx:
-                if self._search_chunk(back_fast.prev, value):
-                    return True
-                back_idx -= back_fast.gap
-                back_fast = back_fast.prev
-
-        return False
-
-    def _search_chunk(self, fast, value):
-        """Search a chunk of the list for value."""
-        if fast is None or fast.next is None:
+        """Remove first occurrence of value - O(1) average index lookup."""
+        if self.head == self.NIL or value is None:
             return False
 
-        # Check fast node's target
-        if fast.target and fast.target.data == value:
-            self._remove_node_and_update(fast.target, fast)
-            return True
-
-        # Search regular nodes in chunk
-        current = fast.target.next if fast.target else None
-        search_end = fast.next.target
-        if current is None or search_end is None:
+        bucket = self._index.get(value)
+        if not bucket:
             return False
 
-        remaining = fast.next.gap - 1
-        while remaining > 0 and current != search_end:
-            if current.data == value:
-                self._remove_node_and_update(current, fast)
-                return True
-            current = current.next
-            remaining -= 1
-
-        return False
-
-    def _remove_node_and_update(self, node, nearest_fast):
-        """Remove a node and update fast layer."""
-        # Update main list
-        if node.prev:
-            node.prev.next = node.next
-        if node.next:
-            node.next.prev = node.prev
-
-        # Update fast layer
-        if node.fast:
-            self._remove_fast(node.fast)
-        elif nearest_fast.next:
-            nearest_fast.next.gap = max(1, nearest_fast.next.gap - 1)
-
-        self.size -= 1
-        self._check_and_rebalance()
+        if len(bucket) == 1:
+            pos = self._position_of(bucket[0])
+        elif self._sequential:
+            pos = min(bucket)
+        else:
+            # Duplicates on a shuffled layout: one forward vectorized scan
+            # over the traversal order finds the earliest occurrence.
+            order = _collect_order(self._next, self.head, self.size)
+            slots = np.fromiter(bucket, dtype=np.int32, count=len(bucket))
+            pos = int(np.where(np.isin(order, slots))[0][0])
+        self.remove_at(pos)
+        return True
+
+    def _position_of(self, slot):
+        """Recover the list position of a slot."""
+        if self._sequential:
+            return slot
+
+        order = _collect_order(self._next, self.head, self.size)
+        return int(np.where(order == slot)[0][0])
 
     def get_node(self, index):
-        """Get node at index using fast layer - O(sqrt(n)) average."""
+        """Get slot of the node at index using the fast layer - O(sqrt(n)) average."""
         if index < 0 or index >= self.size:
             raise IndexError("Index out of bounds")
 
@@ -422,108 +564,103 @@ class SkipList:
         if index == self.size - 1:
             return self.tail
 
+        # Uniform layout: position and slot coincide, no walk needed
+        if self._sequential:
+            return index
+
         # For small lists, use normal traversal
-        if self.fast_head is None or self.fast_count <= 2 or self.size < self._get_dynamic_skip():
+        if self.fast_count <= 2 or self.size < self._get_dynamic_skip():
             return self._get_node_normal(index)
 
-        # Use fast layer
-        if index <= self.size // 2:
-            # Forward from head
-            cur = self.head
-            fast = self.fast_head
-            walked = 0
-
-            while fast and fast.next and fast.next != self.fast_tail:
-                if walked + fast.next.gap > index:
-                    break
-                walked += fast.next.gap
-                fast = fast.next
-                if not fast or not fast.target:
-                    return self._get_node_normal(index)
-                cur = fast.target
-
-            while walked < index and cur:
-                cur = cur.next
-                walked += 1
-            return cur
-        else:
-            # Backward from tail
-            cur = self.tail
-            fast = self.fast_tail
-            walked = self.size - 1
-
-            while fast and fast.prev and fast.prev != self.fast_head:
-                if walked - fast.gap < index:
-                    break
-                walked -= fast.gap
-                fast = fast.prev
-                if not fast or not fast.target:
-                    return self._get_node_normal(index)
-                cur = fast.target
-
-            while walked > index and cur:
-                cur = cur.prev
-                walked -= 1
-            return cur
+        # Use fast layer: binary search over the cumulative gaps, then a
+        # short refinement walk from the nearest fast target
+        slot, _, _ = self._locate(index)
+        return slot
 
     def _get_node_normal(self, index):
-        """Fallback: normal doubly-linked list traversal."""
+        """Fallback: plain traversal over the link arrays."""
         if index < 0 or index >= self.size:
             raise IndexError("Index out of bounds")
 
         if index <= self.size // 2:
             # Forward from head
-            cur = self.head
-            for _ in range(index):
-                if cur is None:
-                    break
-                cur = cur.next
-            return cur
+            return int(_walk_forward(self._next, self.head, index))
         else:
             # Backward from tail
-            cur = self.tail
-            for _ in range(self.size - 1 - index):
-                if cur is None:
-                    break
-                cur = cur.prev
-            return cur
+            return int(_walk_backward(self._prev, self.tail, self.size - 1 - index))
+
+    def _compact(self):
+        """Relayout the arrays so slot order matches list order.
+
+        After heavy churn the links point at scattered slots and every hop
+        lands on a different cache line. Compaction permutes the payloads
+        into slots 0..size-1 in traversal order and rebuilds the links as
+        consecutive indices, so walks read the arrays sequentially, one
+        cache line covers many links, and the hardware prefetcher can run
+        ahead of the refinement walk (the closest this layout gets to
+        explicit software prefetching).
+        """
+        size = self.size
+        if size == 0:
+            return
+        order = _collect_order(self._next, self.head, size)
+        if not np.array_equal(order, np.arange(size, dtype=np.int32)):
+            self._data[:size] = self._data[order]
+            self._data[size:] = None if self._dtype is None else 0
+            self._next[:size] = np.arange(1, size + 1, dtype=np.int32)
+            self._next[size - 1] = self.NIL
+            self._prev[:size] = np.arange(-1, size - 1, dtype=np.int32)
+            self.head = 0
+            self.tail = size - 1
+            self._free = list(range(len(self._data) - 1, size - 1, -1))
+
+            index = {}
+            data = self._data
+            for i in range(size):
+                index.setdefault(data[i], deque()).appendleft(i)
+            self._index = index
+
+        # With the live slots packed at the front, hand capacity back when
+        # occupancy drops below a quarter so the free list stays bounded.
+        cap = len(self._data)
+        if cap > self.INITIAL_CAPACITY and size <= cap // 4:
+            new_cap = cap
+            while new_cap > self.INITIAL_CAPACITY and size <= new_cap // 4:
+                new_cap //= 2
+            self._data = self._data[:new_cap].copy()
+            self._next = self._next[:new_cap].copy()
+            self._prev = self._prev[:new_cap].copy()
+            self._free = list(range(new_cap - 1, size - 1, -1))
+
+        self._sequential = True
 
     def _rebalance(self):
         """Rebuild fast layer with optimal spacing."""
-        if self.fast_head is None or self.fast_tail is None or self.head is None:
+        if self.fast_count < 2 or self.head == self.NIL:
             return
 
-        # Adjust skip distance if density is suboptimal
-        if self.fast_count < (self.size ** 0.5) / 2:
-            self.current_skip = max(self.MIN_SKIP, self.current_skip // 2)
-
-        # Clear existing fast nodes (except sentinels)
-        current = self.fast_head.next
-        while current and current != self.fast_tail:
-            if current.target:
-                current.target.fast = None
-            current = current.next
-
-        # Reset to just sentinels
-        self.fast_head.next = self.fast_tail
-        self.fast_tail.prev = self.fast_head
-        self.fast_count = 2
-
-        # Rebuild with optimal spacing
+        # Defragment first; afterwards slot k holds the node at position k,
+        # so the fast targets are the promotion positions themselves.
+        self._compact()
         skip = self._get_dynamic_skip()
-        counter = 0
-        main_cur = self.head
-        gap = 0
-
-        while main_cur and main_cur != self.tail:
-            gap += 1
-            if counter > 0 and counter % skip == 0 and main_cur.next:
-                self._append_fast(main_cur, gap)
-                gap = 0
-            main_cur = main_cur.next
-            counter += 1
-
-        self._update_tail_fast()
+        k = (self.size - 2) // skip if self.size > 1 else 0
+
+        self._ensure_fast_capacity(k + 2)
+        target = self._fast_target
+        gap = self._fast_gap
+        cum = self._fast_cum
+        target[0] = self.head
+        gap[0] = 0
+        cum[0] = 0
+        if k:
+            positions = np.arange(skip, skip * k + 1, skip, dtype=np.int32)
+            target[1:k + 1] = positions
+            cum[1:k + 1] = positions
+            gap[1:k + 1] = skip
+        target[k + 1] = self.tail
+        gap[k + 1] = (self.size - 1) - skip * k
+        cum[k + 1] = self.size - 1
+        self.fast_count = k + 2
 
     # -------------------------------
     # Public API
@@ -534,16 +671,56 @@ class SkipList:
 
     def get(self, index):
         """Get element at index."""
-        return self.get_node(index).data
+        return self._value_at(self.get_node(index))
+
+    def get_many(self, indices):
+        """Get elements at several indices - one vectorized layer search.
+
+        np.searchsorted resolves every index's fast entry in a single
+        C-level binary-search pass over the cumulative positions; only the
+        short refinement walks run per element. The scalar get() keeps its
+        own path since the batched call only pays off for many indices.
+        """
+        idx = np.asarray(indices, dtype=np.int64)
+        if idx.size == 0:
+            return []
+        if idx.size and (idx.min() < 0 or idx.max() >= self.size):
+            raise IndexError("Index out of bounds")
+
+        data = self._data
+        if self._sequential:
+            return data[idx].tolist()
+        if self.fast_count == 0:
+            return data[[self.get_node(int(i)) for i in idx]].tolist()
+
+        fc = self.fast_count
+        cum = self._fast_cum[:fc]
+        ks = np.searchsorted(cum, idx, side='right') - 1
+        starts = self._fast_target[:fc][ks]
+        offsets = idx - cum[ks]
+
+        nxt = self._next
+        slots = [int(_walk_forward(nxt, int(s), int(off)))
+                 for s, off in zip(starts, offsets)]
+        return data[slots].tolist()
 
     def clear(self):
         """Remove all elements."""
-        self.head = self.tail = None
+        cap = self.INITIAL_CAPACITY
+        self._data = self._new_data(cap)
+        self._next = np.full(cap, self.NIL, dtype=np.int32)
+        self._prev = np.full(cap, self.NIL, dtype=np.int32)
+        self._free = list(range(cap - 1, -1, -1))
+        fast_cap = self.INITIAL_FAST_CAPACITY
+        self._fast_target = np.full(fast_cap, self.NIL, dtype=np.int32)
+        self._fast_gap = np.zeros(fast_cap, dtype=np.int32)
+        self._fast_cum = np.zeros(fast_cap, dtype=np.int32)
+        self.head = self.tail = self.NIL
         self._clear_fast_layer()
         self.size = 0
-        self.pending_gap = 0
         self.ops_since_rebalance = 0
-        self.current_skip = self.MIN_SKIP
+        self._sequential = True
+        self._index = {}
 
 
 # Demo usage
@@ -568,4 +745,4 @@ if __name__ == "__main__":
 
     # Test remove by value
     result = lst.remove(42)
-    print(f"Removed 42: {result}")
\ No newline at end of file
+    print(f"Removed 42: {result}")